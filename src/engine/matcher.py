@@ -1,10 +1,15 @@
 """Core reconciliation matching engine."""
 
-from collections import defaultdict
+import bisect
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import timedelta
 from decimal import Decimal
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
 from src.engine.models import (
     MatchConfidence,
     MatchResult,
@@ -14,6 +19,198 @@ from src.engine.models import (
 )
 
 
+@lru_cache(maxsize=4096)
+def _score(
+    date_diff: int, bank_cents: int, int_cents: int, threshold_bp: int
+) -> Optional[Tuple[float, float]]:
+    """
+    Score a candidate pair, or return ``None`` if outside the amount
+    threshold.
+
+    Memoized on small integer tuples: recurring fees and payroll runs
+    repeat the same (date diff, amount pair) combinations constantly,
+    so repeated divisions collapse into cache hits. Returns
+    ``(score, amount_diff_pct)`` — lower score is better.
+    """
+    if bank_cents == 0:
+        if int_cents != 0:
+            return None
+        pct = 0.0
+    else:
+        diff = bank_cents - int_cents
+        if diff < 0:
+            diff = -diff
+        if diff * 10000 > threshold_bp * bank_cents:
+            return None
+        pct = diff / bank_cents
+
+    return date_diff + pct * 100.0, pct
+
+
+#: Date-window width above which the fuzzy kernel switches to NumPy
+#: array arithmetic; narrow windows stay on the scalar loop.
+_VECTORIZE_MIN_WINDOW = 64
+
+
+def _best_fuzzy_window_vec(
+    bank_ord: int,
+    bank_cents: int,
+    threshold_bp: int,
+    lo: int,
+    hi: int,
+    arrays: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+) -> Optional[Tuple[int, int, float]]:
+    """
+    Vectorized scoring of one date window.
+
+    ``arrays`` holds the sort-order ordinal/cents/position arrays plus a
+    live uint8 view of the matched mask. Scores the whole ``[lo, hi)``
+    slice in C and returns ``(window index, date_diff_days,
+    amount_diff_pct)`` for the best unmatched candidate, or ``None``.
+    Mirrors the scalar loop exactly, including first-wins tie-breaking.
+    """
+    ords, cents, positions, matched = arrays
+    window_cents = cents[lo:hi]
+
+    diff = np.abs(window_cents - bank_cents)
+    valid = (matched[positions[lo:hi]] == 0) & (
+        diff * 10000 <= threshold_bp * bank_cents
+    )
+    if not valid.any():
+        return None
+
+    date_diff = np.abs(ords[lo:hi] - bank_ord)
+    pct = diff / bank_cents if bank_cents else np.zeros(len(diff))
+    score = np.where(valid, date_diff + pct * 100.0, np.inf)
+
+    best = int(score.argmin())
+    return lo + best, int(date_diff[best]), float(pct[best])
+
+
+def _best_fuzzy_candidate(
+    bank_ord: int,
+    bank_cents: int,
+    tolerance_days: int,
+    threshold_bp: int,
+    sorted_internal: List[Tuple[int, Transaction, int]],
+    internal_ords: List[int],
+    matched: bytearray,
+    arrays: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = None,
+) -> Optional[Tuple[Transaction, int, int, float]]:
+    """
+    Numeric kernel for fuzzy matching.
+
+    ``sorted_internal`` holds ``(position, transaction, abs cents)``
+    triples sorted by day ordinal with ``internal_ords`` as the parallel
+    sort keys; bisect bounds the scan to the date-tolerance window and
+    ``matched`` is a by-position byte mask. Candidates are scored on
+    integer cents and ordinals (no Decimal/datetime objects in the
+    loop); returns the best ``(transaction, position, date_diff_days,
+    amount_diff_pct)`` or ``None``. ``threshold_bp`` is the amount
+    threshold in basis points.
+    """
+    best_txn: Optional[Transaction] = None
+    best_pos = -1
+    best_date_diff = 0
+    best_pct = 0.0
+    best_score = float("inf")
+
+    # Hoist lookups out of the candidate loop
+    score_pair = _score
+
+    lo = bisect.bisect_left(internal_ords, bank_ord - tolerance_days)
+    hi = bisect.bisect_right(internal_ords, bank_ord + tolerance_days)
+
+    if arrays is not None and hi - lo >= _VECTORIZE_MIN_WINDOW:
+        found = _best_fuzzy_window_vec(
+            bank_ord, bank_cents, threshold_bp, lo, hi, arrays
+        )
+        if found is None:
+            return None
+        j, date_diff, pct = found
+        pos, int_txn, _ = sorted_internal[j]
+        return int_txn, pos, date_diff, pct
+
+    for j in range(lo, hi):
+        pos, int_txn, int_cents = sorted_internal[j]
+        if matched[pos]:
+            continue
+
+        int_ord = internal_ords[j]
+        date_diff = bank_ord - int_ord if int_ord < bank_ord else int_ord - bank_ord
+
+        scored = score_pair(date_diff, bank_cents, int_cents, threshold_bp)
+        if scored is None:
+            continue
+
+        score, pct = scored
+        if score < best_score:
+            best_score = score
+            best_txn = int_txn
+            best_pos = pos
+            best_date_diff = date_diff
+            best_pct = pct
+
+    if best_pos < 0:
+        return None
+    return best_txn, best_pos, best_date_diff, best_pct
+
+
+# Per-process state for the parallel fuzzy proposal phase; populated by
+# the pool initializer so the candidate arrays are shipped to each
+# worker once instead of once per task.
+_WORKER_STATE: dict = {}
+
+
+def _init_fuzzy_worker(
+    sorted_internal: List[Tuple[int, None, int]],
+    internal_ords: List[int],
+    tolerance_days: int,
+    threshold_bp: int,
+    matched_snapshot: bytes,
+) -> None:
+    """Initializer for fuzzy proposal workers."""
+    _WORKER_STATE["sorted_internal"] = sorted_internal
+    _WORKER_STATE["internal_ords"] = internal_ords
+    _WORKER_STATE["tolerance_days"] = tolerance_days
+    _WORKER_STATE["threshold_bp"] = threshold_bp
+    _WORKER_STATE["matched"] = matched_snapshot
+
+
+def _propose_fuzzy_chunk(
+    chunk: List[Tuple[int, int]]
+) -> List[Optional[Tuple[int, int, float]]]:
+    """
+    Compute fuzzy proposals for a chunk of (day ordinal, abs cents) bank
+    transactions against the phase-start matched snapshot. Returns one
+    ``(position, date_diff_days, amount_diff_pct)`` or ``None`` entry
+    per input.
+    """
+    state = _WORKER_STATE
+    sorted_internal = state["sorted_internal"]
+    internal_ords = state["internal_ords"]
+    tolerance_days = state["tolerance_days"]
+    threshold_bp = state["threshold_bp"]
+    matched = state["matched"]
+
+    proposals: List[Optional[Tuple[int, int, float]]] = []
+    for bank_ord, bank_cents in chunk:
+        best = _best_fuzzy_candidate(
+            bank_ord, bank_cents, tolerance_days, threshold_bp,
+            sorted_internal, internal_ords, matched,
+        )
+        proposals.append(None if best is None else best[1:])
+    return proposals
+
+
+# Preformatted reasons for results whose text never varies, so the hot
+# paths only ever attach existing string objects.
+_REASON_EXACT = "Exact match: same date, amount"
+_REASON_EXACT_REF = "Exact match: same date, amount, and reference"
+_REASON_UNMATCHED_BANK = "No matching internal transaction found"
+_REASON_UNMATCHED_INTERNAL = "No matching bank transaction found"
+
+
 class ReconciliationEngine:
     """
     Reconciliation engine that matches bank transactions against internal records.
@@ -24,10 +221,14 @@ class ReconciliationEngine:
     3. Duplicate Detection: Multiple transactions with same amount on same/close dates
     """
 
+    #: Minimum Phase 2 batch size before a worker pool is worth spinning up
+    PARALLEL_MIN_BATCH = 512
+
     def __init__(
         self,
         date_tolerance_days: int = 3,
         amount_threshold: float = 0.02,
+        max_workers: Optional[int] = None,
     ):
         """
         Initialize the reconciliation engine.
@@ -35,9 +236,14 @@ class ReconciliationEngine:
         Args:
             date_tolerance_days: Maximum number of days difference for fuzzy matching.
             amount_threshold: Maximum relative amount difference for fuzzy matching (0.02 = 2%).
+            max_workers: Optional process count for the fuzzy phase; large
+                batches are matched in parallel when set to 2 or more.
         """
         self.date_tolerance = timedelta(days=date_tolerance_days)
         self.amount_threshold = Decimal(str(amount_threshold))
+        self.max_workers = max_workers
+        # Threshold in basis points for integer-only tolerance checks
+        self._threshold_bp = int((self.amount_threshold * 10000).to_integral_value())
 
     def reconcile(
         self,
@@ -55,82 +261,198 @@ class ReconciliationEngine:
             Tuple of (list of match results, summary statistics).
         """
         results: List[MatchResult] = []
-        matched_internal: set = set()
+        # By-position byte mask of matched internal transactions
+        matched_internal = bytearray(len(internal_transactions))
+        matched_bank_ids: set = set()
 
-        # Build index for faster lookup
-        internal_index = self._build_amount_index(internal_transactions)
+        # Summary counters are maintained inline as each result is
+        # appended, so no second pass over `results` is needed.
+        summary = ReconciliationSummary(
+            total_bank_transactions=len(bank_transactions),
+            total_internal_transactions=len(internal_transactions),
+        )
+        matched_cents = 0
+        unmatched_bank_cents = 0
+        unmatched_internal_cents = 0
+
+        # Build indexes for faster lookup
+        exact_index = self._build_exact_index(internal_transactions)
+        sorted_internal = sorted(
+            (
+                (pos, txn, abs(txn.amount_cents))
+                for pos, txn in enumerate(internal_transactions)
+            ),
+            key=lambda item: item[1].date_ordinal,
+        )
+        internal_ords = [txn.date_ordinal for _, txn, _ in sorted_internal]
+        summary.total_internal_amount_cents = sum(
+            cents for _, _, cents in sorted_internal
+        )
+        # SoA mirror of the candidate data for the vectorized fuzzy
+        # kernel; the last entry is a live view of the matched mask, so
+        # no per-probe copies are needed.
+        fuzzy_arrays = (
+            (
+                np.array(internal_ords, dtype=np.int64),
+                np.array([cents for _, _, cents in sorted_internal], dtype=np.int64),
+                np.array([pos for pos, _, _ in sorted_internal], dtype=np.intp),
+                np.frombuffer(matched_internal, dtype=np.uint8),
+            )
+            if internal_transactions
+            else None
+        )
 
         # Phase 1: Exact matches
         for bank_txn in bank_transactions:
-            match = self._find_exact_match(bank_txn, internal_index, matched_internal)
-            if match:
+            summary.total_bank_amount_cents += abs(bank_txn.amount_cents)
+            found = self._find_exact_match(bank_txn, exact_index, matched_internal)
+            if found:
+                match, pos = found
                 results.append(match)
-                matched_internal.add(match.internal_transaction.id)
+                matched_internal[pos] = 1
+                matched_bank_ids.add(bank_txn.id)
+                summary.total_exact_matches += 1
+                matched_cents += abs(bank_txn.amount_cents)
 
         # Phase 2: Fuzzy matches for remaining
         unmatched_bank = [
-            txn for txn in bank_transactions
-            if not any(r.bank_transaction.id == txn.id and r.is_matched for r in results)
+            txn for txn in bank_transactions if txn.id not in matched_bank_ids
         ]
 
-        for bank_txn in unmatched_bank:
-            match = self._find_fuzzy_match(bank_txn, internal_transactions, matched_internal)
-            if match:
+        find_fuzzy = self._find_fuzzy_match
+
+        # Optionally precompute fuzzy proposals in parallel against the
+        # phase-start matched state; conflicts fall back to a serial
+        # recompute below, so the outcome is identical to a serial run.
+        proposals: Optional[List[Optional[Tuple[int, int, float]]]] = None
+        if (
+            self.max_workers
+            and self.max_workers > 1
+            and len(unmatched_bank) >= self.PARALLEL_MIN_BATCH
+        ):
+            proposals = self._propose_fuzzy_parallel(
+                unmatched_bank, sorted_internal, internal_ords, matched_internal
+            )
+
+        for i, bank_txn in enumerate(unmatched_bank):
+            if proposals is not None:
+                proposal = proposals[i]
+                if proposal is None:
+                    # No candidate existed under the wider phase-start
+                    # mask, so none exists now either.
+                    found = None
+                elif not matched_internal[proposal[0]]:
+                    pos, date_diff, pct = proposal
+                    int_txn = internal_transactions[pos]
+                    found = self._make_fuzzy_result(bank_txn, int_txn, date_diff, pct), pos
+                else:
+                    # Proposed internal was claimed by an earlier bank
+                    # txn; redo this one against the current mask.
+                    found = find_fuzzy(
+                        bank_txn, sorted_internal, internal_ords,
+                        matched_internal, fuzzy_arrays,
+                    )
+            else:
+                found = find_fuzzy(
+                    bank_txn, sorted_internal, internal_ords,
+                    matched_internal, fuzzy_arrays,
+                )
+            if found:
+                match, pos = found
                 results.append(match)
-                matched_internal.add(match.internal_transaction.id)
+                matched_internal[pos] = 1
+                summary.total_fuzzy_matches += 1
+                matched_cents += abs(bank_txn.amount_cents)
             else:
                 results.append(MatchResult(
                     bank_transaction=bank_txn,
                     internal_transaction=None,
                     status=MatchStatus.UNMATCHED_BANK,
                     confidence=MatchConfidence.LOW,
-                    match_reason="No matching internal transaction found",
+                    match_reason=_REASON_UNMATCHED_BANK,
                 ))
+                summary.total_unmatched_bank += 1
+                unmatched_bank_cents += abs(bank_txn.amount_cents)
 
         # Phase 3: Unmatched internal transactions
-        for int_txn in internal_transactions:
-            if int_txn.id not in matched_internal:
+        for pos, int_txn in enumerate(internal_transactions):
+            if not matched_internal[pos]:
                 results.append(MatchResult(
                     bank_transaction=None,
                     internal_transaction=int_txn,
                     status=MatchStatus.UNMATCHED_INTERNAL,
                     confidence=MatchConfidence.LOW,
-                    match_reason="No matching bank transaction found",
+                    match_reason=_REASON_UNMATCHED_INTERNAL,
                 ))
+                summary.total_unmatched_internal += 1
+                unmatched_internal_cents += abs(int_txn.amount_cents)
 
         # Phase 4: Detect duplicates
         duplicates = self._detect_duplicates(bank_transactions, internal_transactions)
         results.extend(duplicates)
+        summary.total_duplicates = len(duplicates)
 
-        # Generate summary
-        summary = self._generate_summary(results, bank_transactions, internal_transactions)
+        summary.total_matched = (
+            summary.total_exact_matches + summary.total_fuzzy_matches
+        )
+        summary.matched_amount_cents = matched_cents
+        summary.unmatched_bank_amount_cents = unmatched_bank_cents
+        summary.unmatched_internal_amount_cents = unmatched_internal_cents
 
         return results, summary
 
-    def _build_amount_index(
+    def _build_exact_index(
         self, transactions: List[Transaction]
-    ) -> Dict[Decimal, List[Transaction]]:
-        """Build an index of transactions by absolute amount for fast lookup."""
-        index: Dict[Decimal, List[Transaction]] = defaultdict(list)
-        for txn in transactions:
-            index[txn.abs_amount].append(txn)
-        return index
+    ) -> Tuple[Dict[Tuple, List[Tuple[int, Transaction]]], Dict[Tuple, List[Tuple[int, Transaction]]]]:
+        """
+        Build hash indexes for O(1) exact-match lookup.
+
+        Returns a pair of dicts: one keyed on (abs cents, day ordinal)
+        and one on (abs cents, day ordinal, reference) for transactions
+        that carry a reference. Entries are (position, transaction)
+        pairs so matched state can be tracked by position.
+        """
+        by_key: Dict[Tuple, List[Tuple[int, Transaction]]] = defaultdict(list)
+        by_ref: Dict[Tuple, List[Tuple[int, Transaction]]] = defaultdict(list)
+        for pos, txn in enumerate(transactions):
+            key = (abs(txn.amount_cents), txn.date_ordinal)
+            by_key[key].append((pos, txn))
+            if txn.reference:
+                by_ref[key + (txn.reference,)].append((pos, txn))
+        return by_key, by_ref
 
     def _find_exact_match(
         self,
         bank_txn: Transaction,
-        internal_index: Dict[Decimal, List[Transaction]],
-        matched: set,
-    ) -> Optional[MatchResult]:
+        exact_index: Tuple[Dict[Tuple, List[Tuple[int, Transaction]]], Dict[Tuple, List[Tuple[int, Transaction]]]],
+        matched: bytearray,
+    ) -> Optional[Tuple[MatchResult, int]]:
         """Find an exact match for a bank transaction."""
-        candidates = internal_index.get(bank_txn.abs_amount, [])
-
-        for int_txn in candidates:
-            if int_txn.id in matched:
-                continue
-
-            # Check exact date match
-            if bank_txn.date.date() != int_txn.date.date():
+        by_key, by_ref = exact_index
+        key = (abs(bank_txn.amount_cents), bank_txn.date_ordinal)
+
+        # Prefer reference-tied candidates when the bank txn has one.
+        # Consumed or already-matched entries are deleted in place so
+        # heavily shared keys don't rescan dead candidates on every
+        # probe.
+        if bank_txn.reference:
+            candidates = by_ref.get(key + (bank_txn.reference,), [])
+            i = 0
+            while i < len(candidates):
+                pos, int_txn = candidates[i]
+                if matched[pos]:
+                    # Claimed through the other index; drop the entry.
+                    del candidates[i]
+                    continue
+                del candidates[i]
+                return self._make_exact_result(bank_txn, int_txn), pos
+
+        candidates = by_key.get(key, [])
+        i = 0
+        while i < len(candidates):
+            pos, int_txn = candidates[i]
+            if matched[pos]:
+                del candidates[i]
                 continue
 
             # Check reference match (if both have references)
@@ -139,72 +461,116 @@ class ReconciliationEngine:
                 and int_txn.reference
                 and bank_txn.reference != int_txn.reference
             ):
+                i += 1
                 continue
 
-            return MatchResult(
-                bank_transaction=bank_txn,
-                internal_transaction=int_txn,
-                status=MatchStatus.EXACT,
-                confidence=MatchConfidence.HIGH,
-                date_diff_days=0,
-                amount_diff=Decimal("0"),
-                match_reason="Exact match: same date, amount" + (
-                    ", and reference" if bank_txn.reference and int_txn.reference else ""
-                ),
-            )
+            del candidates[i]
+            return self._make_exact_result(bank_txn, int_txn), pos
 
         return None
 
+    def _make_exact_result(
+        self, bank_txn: Transaction, int_txn: Transaction
+    ) -> MatchResult:
+        """Build the MatchResult for an exact match."""
+        return MatchResult(
+            bank_transaction=bank_txn,
+            internal_transaction=int_txn,
+            status=MatchStatus.EXACT,
+            confidence=MatchConfidence.HIGH,
+            date_diff_days=0,
+            amount_diff=Decimal("0"),
+            match_reason=(
+                _REASON_EXACT_REF
+                if bank_txn.reference and int_txn.reference
+                else _REASON_EXACT
+            ),
+        )
+
     def _find_fuzzy_match(
         self,
         bank_txn: Transaction,
-        internal_transactions: List[Transaction],
-        matched: set,
-    ) -> Optional[MatchResult]:
+        sorted_internal: List[Tuple[int, Transaction, int]],
+        internal_ords: List[int],
+        matched: bytearray,
+        arrays: Optional[Tuple[np.ndarray, ...]] = None,
+    ) -> Optional[Tuple[MatchResult, int]]:
         """Find a fuzzy match within date and amount tolerances."""
-        best_match: Optional[MatchResult] = None
-        best_score = float("inf")
-
-        for int_txn in internal_transactions:
-            if int_txn.id in matched:
-                continue
+        best = _best_fuzzy_candidate(
+            bank_txn.date_ordinal,
+            abs(bank_txn.amount_cents),
+            self.date_tolerance.days,
+            self._threshold_bp,
+            sorted_internal,
+            internal_ords,
+            matched,
+            arrays,
+        )
+        if best is None:
+            return None
 
-            # Check date tolerance
-            date_diff = abs((bank_txn.date.date() - int_txn.date.date()).days)
-            if date_diff > self.date_tolerance.days:
-                continue
+        int_txn, pos, date_diff, amount_diff_pct = best
+        return self._make_fuzzy_result(bank_txn, int_txn, date_diff, amount_diff_pct), pos
 
-            # Check amount tolerance
-            amount_diff = abs(bank_txn.abs_amount - int_txn.abs_amount)
-            if bank_txn.abs_amount == Decimal("0") and int_txn.abs_amount == Decimal("0"):
-                amount_diff_pct = Decimal("0")
-            elif bank_txn.abs_amount == Decimal("0"):
-                continue
-            else:
-                amount_diff_pct = amount_diff / bank_txn.abs_amount
+    def _make_fuzzy_result(
+        self,
+        bank_txn: Transaction,
+        int_txn: Transaction,
+        date_diff: int,
+        amount_diff_pct: float,
+    ) -> MatchResult:
+        """Build the MatchResult for a fuzzy match."""
+        return MatchResult(
+            bank_transaction=bank_txn,
+            internal_transaction=int_txn,
+            status=MatchStatus.FUZZY,
+            confidence=MatchConfidence.MEDIUM if date_diff <= 1 else MatchConfidence.LOW,
+            date_diff_days=date_diff,
+            amount_diff=abs(bank_txn.amount - int_txn.amount),
+            match_reason=(
+                f"Fuzzy match: {date_diff}d date diff, "
+                f"{amount_diff_pct:.2%} amount diff"
+            ),
+        )
 
-            if amount_diff_pct > self.amount_threshold:
-                continue
+    def _propose_fuzzy_parallel(
+        self,
+        bank_txns: List[Transaction],
+        sorted_internal: List[Tuple[int, Transaction, int]],
+        internal_ords: List[int],
+        matched: bytearray,
+    ) -> List[Optional[Tuple[int, int, float]]]:
+        """
+        Fan the fuzzy candidate search out over a process pool.
 
-            # Score: lower is better (prefer closer dates and amounts)
-            score = date_diff + float(amount_diff_pct) * 100
+        Workers receive position/cents/ordinal arrays (no Transaction
+        objects cross the process boundary) plus a snapshot of the
+        matched mask, and return one proposal per bank transaction.
+        """
+        payload = [(t.date_ordinal, abs(t.amount_cents)) for t in bank_txns]
+        # Strip Transaction objects; the kernel never dereferences them.
+        lite_internal = [(pos, None, cents) for pos, _, cents in sorted_internal]
 
-            if score < best_score:
-                best_score = score
-                best_match = MatchResult(
-                    bank_transaction=bank_txn,
-                    internal_transaction=int_txn,
-                    status=MatchStatus.FUZZY,
-                    confidence=MatchConfidence.MEDIUM if date_diff <= 1 else MatchConfidence.LOW,
-                    date_diff_days=date_diff,
-                    amount_diff=abs(bank_txn.amount - int_txn.amount),
-                    match_reason=(
-                        f"Fuzzy match: {date_diff}d date diff, "
-                        f"{amount_diff_pct:.2%} amount diff"
-                    ),
-                )
+        chunksize = max(1, len(payload) // (self.max_workers * 4))
+        chunks = [
+            payload[i:i + chunksize] for i in range(0, len(payload), chunksize)
+        ]
 
-        return best_match
+        proposals: List[Optional[Tuple[int, int, float]]] = []
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_fuzzy_worker,
+            initargs=(
+                lite_internal,
+                internal_ords,
+                self.date_tolerance.days,
+                self._threshold_bp,
+                bytes(matched),
+            ),
+        ) as executor:
+            for chunk_result in executor.map(_propose_fuzzy_chunk, chunks):
+                proposals.extend(chunk_result)
+        return proposals
 
     def _detect_duplicates(
         self,
@@ -214,79 +580,42 @@ class ReconciliationEngine:
         """Detect potential duplicate transactions."""
         duplicates: List[MatchResult] = []
 
-        # Check for duplicates within bank transactions
-        bank_by_key: Dict[str, List[Transaction]] = defaultdict(list)
+        # Check for duplicates within bank transactions. Keys are
+        # (day ordinal, abs cents) tuples — no string formatting.
+        bank_counts = Counter(
+            (txn.date_ordinal, abs(txn.amount_cents)) for txn in bank_transactions
+        )
+        seen: set = set()
         for txn in bank_transactions:
-            key = f"{txn.date.date()}|{txn.abs_amount}"
-            bank_by_key[key].append(txn)
-
-        for key, txns in bank_by_key.items():
-            if len(txns) > 1:
-                for txn in txns[1:]:  # Flag all but the first as duplicates
-                    duplicates.append(MatchResult(
-                        bank_transaction=txn,
-                        internal_transaction=None,
-                        status=MatchStatus.DUPLICATE,
-                        confidence=MatchConfidence.MEDIUM,
-                        match_reason=f"Potential duplicate: {len(txns)} bank transactions "
-                                     f"with same date and amount",
-                    ))
+            key = (txn.date_ordinal, abs(txn.amount_cents))
+            if bank_counts[key] > 1 and key in seen:  # Flag all but the first
+                duplicates.append(MatchResult(
+                    bank_transaction=txn,
+                    internal_transaction=None,
+                    status=MatchStatus.DUPLICATE,
+                    confidence=MatchConfidence.MEDIUM,
+                    match_reason=f"Potential duplicate: {bank_counts[key]} bank transactions "
+                                 f"with same date and amount",
+                ))
+            seen.add(key)
 
         # Check for duplicates within internal transactions
-        internal_by_key: Dict[str, List[Transaction]] = defaultdict(list)
+        internal_counts = Counter(
+            (txn.date_ordinal, abs(txn.amount_cents)) for txn in internal_transactions
+        )
+        seen = set()
         for txn in internal_transactions:
-            key = f"{txn.date.date()}|{txn.abs_amount}"
-            internal_by_key[key].append(txn)
-
-        for key, txns in internal_by_key.items():
-            if len(txns) > 1:
-                for txn in txns[1:]:
-                    duplicates.append(MatchResult(
-                        bank_transaction=None,
-                        internal_transaction=txn,
-                        status=MatchStatus.DUPLICATE,
-                        confidence=MatchConfidence.MEDIUM,
-                        match_reason=f"Potential duplicate: {len(txns)} internal transactions "
-                                     f"with same date and amount",
-                    ))
+            key = (txn.date_ordinal, abs(txn.amount_cents))
+            if internal_counts[key] > 1 and key in seen:
+                duplicates.append(MatchResult(
+                    bank_transaction=None,
+                    internal_transaction=txn,
+                    status=MatchStatus.DUPLICATE,
+                    confidence=MatchConfidence.MEDIUM,
+                    match_reason=f"Potential duplicate: {internal_counts[key]} internal transactions "
+                                 f"with same date and amount",
+                ))
+            seen.add(key)
 
         return duplicates
 
-    def _generate_summary(
-        self,
-        results: List[MatchResult],
-        bank_transactions: List[Transaction],
-        internal_transactions: List[Transaction],
-    ) -> ReconciliationSummary:
-        """Generate reconciliation summary statistics."""
-        summary = ReconciliationSummary(
-            total_bank_transactions=len(bank_transactions),
-            total_internal_transactions=len(internal_transactions),
-        )
-
-        for result in results:
-            if result.status == MatchStatus.EXACT:
-                summary.total_matched += 1
-                summary.total_exact_matches += 1
-                if result.bank_transaction:
-                    summary.matched_amount += result.bank_transaction.abs_amount
-            elif result.status == MatchStatus.FUZZY:
-                summary.total_matched += 1
-                summary.total_fuzzy_matches += 1
-                if result.bank_transaction:
-                    summary.matched_amount += result.bank_transaction.abs_amount
-            elif result.status == MatchStatus.UNMATCHED_BANK:
-                summary.total_unmatched_bank += 1
-                if result.bank_transaction:
-                    summary.unmatched_bank_amount += result.bank_transaction.abs_amount
-            elif result.status == MatchStatus.UNMATCHED_INTERNAL:
-                summary.total_unmatched_internal += 1
-                if result.internal_transaction:
-                    summary.unmatched_internal_amount += result.internal_transaction.abs_amount
-            elif result.status == MatchStatus.DUPLICATE:
-                summary.total_duplicates += 1
-
-        summary.total_bank_amount = sum(t.abs_amount for t in bank_transactions)
-        summary.total_internal_amount = sum(t.abs_amount for t in internal_transactions)
-
-        return summary
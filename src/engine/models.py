@@ -1,11 +1,17 @@
 """Data models for the reconciliation engine."""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from decimal import Decimal
+from decimal import ROUND_HALF_EVEN, Context, Decimal
 from enum import Enum
 from typing import Optional
 
+#: Arithmetic context for money values. 18 digits comfortably covers
+#: statement amounts, and create_decimal on a fixed context skips the
+#: per-call thread-context lookup of the Decimal constructor.
+MONEY_CONTEXT = Context(prec=18, rounding=ROUND_HALF_EVEN)
+
 
 class TransactionType(Enum):
     """Transaction type classification."""
@@ -29,9 +35,9 @@ class MatchConfidence(Enum):
     LOW = "low"          # Partial match, needs review
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Transaction:
-    """Represents a single financial transaction."""
+    """Represents a single financial transaction; immutable once built."""
     id: str
     date: datetime
     amount: Decimal
@@ -40,6 +46,19 @@ class Transaction:
     reference: Optional[str] = None
     source: str = ""  # "bank" or "internal"
     raw_data: dict = field(default_factory=dict)
+    amount_cents: int = field(init=False, repr=False, default=0)
+    date_ordinal: int = field(init=False, repr=False, default=0)
+
+    def __post_init__(self):
+        # Integer minor units and day ordinal for hot-path arithmetic;
+        # Decimal/datetime stay the source of truth for display. The
+        # class is frozen, so derived fields go through object.__setattr__.
+        set_field = object.__setattr__
+        set_field(self, "amount_cents", int((self.amount * 100).to_integral_value()))
+        set_field(self, "date_ordinal", self.date.toordinal())
+        # Interned references compare by pointer in the exact-match path.
+        if self.reference:
+            set_field(self, "reference", sys.intern(self.reference))
 
     @property
     def abs_amount(self) -> Decimal:
@@ -53,7 +72,7 @@ class Transaction:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchResult:
     """Result of matching two transactions."""
     bank_transaction: Optional[Transaction]
@@ -70,9 +89,14 @@ class MatchResult:
         return self.status in (MatchStatus.EXACT, MatchStatus.FUZZY)
 
 
-@dataclass
+@dataclass(slots=True)
 class ReconciliationSummary:
-    """Summary statistics for a reconciliation run."""
+    """
+    Summary statistics for a reconciliation run.
+
+    Amounts are stored as integer cents so accumulation stays in native
+    int arithmetic; the Decimal views are exposed as properties.
+    """
     total_bank_transactions: int = 0
     total_internal_transactions: int = 0
     total_matched: int = 0
@@ -81,11 +105,36 @@ class ReconciliationSummary:
     total_unmatched_bank: int = 0
     total_unmatched_internal: int = 0
     total_duplicates: int = 0
-    total_bank_amount: Decimal = Decimal("0")
-    total_internal_amount: Decimal = Decimal("0")
-    matched_amount: Decimal = Decimal("0")
-    unmatched_bank_amount: Decimal = Decimal("0")
-    unmatched_internal_amount: Decimal = Decimal("0")
+    total_bank_amount_cents: int = 0
+    total_internal_amount_cents: int = 0
+    matched_amount_cents: int = 0
+    unmatched_bank_amount_cents: int = 0
+    unmatched_internal_amount_cents: int = 0
+
+    @property
+    def total_bank_amount(self) -> Decimal:
+        """Total absolute bank amount."""
+        return Decimal(self.total_bank_amount_cents) / 100
+
+    @property
+    def total_internal_amount(self) -> Decimal:
+        """Total absolute internal amount."""
+        return Decimal(self.total_internal_amount_cents) / 100
+
+    @property
+    def matched_amount(self) -> Decimal:
+        """Total absolute amount of matched bank transactions."""
+        return Decimal(self.matched_amount_cents) / 100
+
+    @property
+    def unmatched_bank_amount(self) -> Decimal:
+        """Total absolute amount of unmatched bank transactions."""
+        return Decimal(self.unmatched_bank_amount_cents) / 100
+
+    @property
+    def unmatched_internal_amount(self) -> Decimal:
+        """Total absolute amount of unmatched internal transactions."""
+        return Decimal(self.unmatched_internal_amount_cents) / 100
 
     @property
     def match_rate(self) -> float:
@@ -98,4 +147,6 @@ class ReconciliationSummary:
     @property
     def amount_difference(self) -> Decimal:
         """Calculate total amount difference."""
-        return self.total_bank_amount - self.total_internal_amount
+        return Decimal(
+            self.total_bank_amount_cents - self.total_internal_amount_cents
+        ) / 100
@@ -1,18 +1,37 @@
 """CSV/Excel internal records parser."""
 
 import logging
+import re
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from uuid import uuid4
 
 import pandas as pd
 
-from src.engine.models import Transaction, TransactionType
+from src.engine.models import MONEY_CONTEXT, Transaction, TransactionType
 
 logger = logging.getLogger(__name__)
 
+# Currency symbols stripped from amounts, compiled once at import so
+# neither the vectorized cleaner nor the scalar fallback re-parses the
+# pattern per call.
+_CURRENCY_RE = re.compile(r"R?\$")
+
+# Normalized type keyword -> enum, built once at import time so
+# _parse_type is a single dict lookup per row.
+_TYPE_LOOKUP: Dict[str, TransactionType] = {
+    **{
+        word: TransactionType.CREDIT
+        for word in ("credit", "crédito", "credito", "c", "entrada", "receipt")
+    },
+    **{
+        word: TransactionType.DEBIT
+        for word in ("debit", "débito", "debito", "d", "saída", "saida", "payment")
+    },
+}
+
 
 class CSVParser:
     """Parse CSV/Excel internal accounting records into Transaction objects."""
@@ -36,15 +55,24 @@ class CSVParser:
         "%d.%m.%Y",
     ]
 
-    def __init__(self, column_mapping: Optional[Dict[str, str]] = None):
+    def __init__(
+        self,
+        column_mapping: Optional[Dict[str, str]] = None,
+        keep_raw: bool = False,
+    ):
         """
         Initialize parser with optional custom column mapping.
 
         Args:
             column_mapping: Dict mapping our field names to CSV column names.
                           Example: {"date": "Data", "amount": "Valor"}
+            keep_raw: Keep a per-row dict of the original cell values on
+                    Transaction.raw_data. Off by default — the audit
+                    copy roughly doubles per-row memory and is rarely
+                    read.
         """
         self.column_mapping = column_mapping or self.DEFAULT_MAPPING
+        self.keep_raw = keep_raw
 
     def parse(self, file_path: str | Path, **kwargs) -> List[Transaction]:
         """
@@ -61,26 +89,79 @@ class CSVParser:
             FileNotFoundError: If the file doesn't exist.
             ValueError: If required columns are missing.
         """
+        return list(self.parse_iter(file_path, **kwargs))
+
+    def parse_iter(
+        self,
+        file_path: str | Path,
+        chunksize: int = 50_000,
+        **kwargs,
+    ) -> Iterator[Transaction]:
+        """
+        Parse a file, yielding Transactions in bounded-memory batches.
+
+        CSV files are read through pandas' chunked reader so peak memory
+        is O(chunksize) rows regardless of file size; Excel files have
+        no chunked reader and are converted in one shot.
+
+        Args:
+            file_path: Path to the CSV/Excel file.
+            chunksize: Rows per CSV chunk.
+            **kwargs: Additional arguments passed to pandas read function.
+
+        Yields:
+            Transaction objects in file order.
+        """
         file_path = Path(file_path)
 
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        df = self._read_file(file_path, **kwargs)
-        self._validate_columns(df)
-        return self._convert_dataframe(df)
+        if file_path.suffix.lower() != ".csv":
+            df = self._read_file(file_path, **kwargs)
+            self._validate_columns(df)
+            yield from self._convert_dataframe(df)
+            return
+
+        offset = 0
+        reader = pd.read_csv(
+            file_path, chunksize=chunksize, **self._csv_read_options(**kwargs)
+        )
+        with reader:
+            for chunk in reader:
+                self._validate_columns(chunk)
+                yield from self._convert_dataframe(chunk, id_offset=offset)
+                offset += len(chunk)
 
     def _read_file(self, file_path: Path, **kwargs) -> pd.DataFrame:
         """Read file based on extension."""
         suffix = file_path.suffix.lower()
 
         if suffix == ".csv":
-            return pd.read_csv(file_path, **kwargs)
+            return pd.read_csv(file_path, **self._csv_read_options(**kwargs))
         elif suffix in (".xlsx", ".xls"):
             return pd.read_excel(file_path, **kwargs)
         else:
             raise ValueError(f"Unsupported file format: {suffix}. Use .csv, .xlsx, or .xls")
 
+    def _csv_read_options(self, **kwargs) -> dict:
+        """Build the read_csv keyword arguments for this parser's mapping."""
+        amount_col = self.column_mapping.get("amount", "amount")
+        if "usecols" not in kwargs and not self.keep_raw:
+            # Only load the mapped columns; extra columns are dead
+            # weight unless the caller asked to keep raw rows. The
+            # callable form tolerates missing columns so
+            # _validate_columns still reports them with its own message.
+            wanted = {
+                self.column_mapping.get(field, field)
+                for field in self.DEFAULT_MAPPING
+            }
+            kwargs["usecols"] = lambda col: col in wanted
+        # Read amounts as strings: skips float inference and keeps the
+        # exact digits for Decimal.
+        kwargs.setdefault("dtype", {amount_col: str})
+        return kwargs
+
     def _validate_columns(self, df: pd.DataFrame) -> None:
         """
         Validate that required columns exist in the dataframe.
@@ -91,9 +172,11 @@ class CSVParser:
         required = ["date", "amount"]
         missing = []
 
+        # Membership against a set rather than the Index, which scans
+        columns = set(df.columns)
         for field in required:
             col_name = self.column_mapping.get(field, field)
-            if col_name not in df.columns:
+            if col_name not in columns:
                 missing.append(f"{field} (expected column: '{col_name}')")
 
         if missing:
@@ -104,13 +187,63 @@ class CSVParser:
                 f"Use column_mapping parameter to map your columns."
             )
 
-    def _convert_dataframe(self, df: pd.DataFrame) -> List[Transaction]:
-        """Convert a DataFrame to list of Transaction objects."""
+    def _convert_dataframe(
+        self, df: pd.DataFrame, id_offset: int = 0
+    ) -> List[Transaction]:
+        """
+        Convert a DataFrame to list of Transaction objects.
+
+        ``id_offset`` keeps generated INT-nnnnnn ids unique across the
+        chunks of one file.
+
+        Columns are pulled out as plain Python lists once and iterated
+        with ``zip``; this avoids the per-row Series that ``iterrows``
+        would materialize for every record.
+        """
         transactions: List[Transaction] = []
+        n = len(df)
+
+        # Resolve mapped column names once, outside the row loop
+        resolve = self.column_mapping.get
+        date_col = resolve("date", "date")
+        amount_col = resolve("amount", "amount")
+        desc_col = resolve("description", "description")
+        ref_col = resolve("reference", "reference")
+        type_col = resolve("type", "type")
+
+        dates = self._parse_date_column(df[date_col])
+        amounts = self._parse_amount_column(df[amount_col])
+        descriptions = (
+            [str(v) for v in df[desc_col].tolist()]
+            if desc_col in df.columns else [""] * n
+        )
+        references = (
+            [str(v) for v in df[ref_col].tolist()]
+            if ref_col in df.columns else [None] * n
+        )
+        if type_col in df.columns:
+            # One vectorized notna pass; missing types become None so the
+            # row converter needs no per-row NaN check.
+            types = [
+                value if present else None
+                for value, present in zip(
+                    df[type_col].tolist(), pd.notna(df[type_col]).tolist()
+                )
+            ]
+        else:
+            types = [None] * n
+        raw_columns = (
+            {col: df[col].tolist() for col in df.columns} if self.keep_raw else {}
+        )
 
-        for idx, row in df.iterrows():
+        rows = zip(dates, amounts, descriptions, references, types)
+        for idx, (date_val, amount_val, description, reference, type_val) in enumerate(rows):
             try:
-                txn = self._convert_row(row, idx)
+                raw_data = {col: values[idx] for col, values in raw_columns.items()}
+                txn = self._convert_row_scalar(
+                    id_offset + idx, date_val, amount_val, description,
+                    reference, type_val, raw_data,
+                )
                 transactions.append(txn)
             except (ValueError, InvalidOperation) as e:
                 # Log warning but continue processing
@@ -118,28 +251,22 @@ class CSVParser:
 
         return transactions
 
-    def _convert_row(self, row: pd.Series, idx: int) -> Transaction:
-        """Convert a single row to a Transaction object."""
-        # Parse date
-        date_col = self.column_mapping.get("date", "date")
-        txn_date = self._parse_date(row[date_col])
-
-        # Parse amount
-        amount_col = self.column_mapping.get("amount", "amount")
-        amount = self._parse_amount(row[amount_col])
-
-        # Parse description
-        desc_col = self.column_mapping.get("description", "description")
-        description = str(row.get(desc_col, "")) if desc_col in row.index else ""
-
-        # Parse reference
-        ref_col = self.column_mapping.get("reference", "reference")
-        reference = str(row.get(ref_col, "")) if ref_col in row.index else None
-
-        # Determine transaction type
-        type_col = self.column_mapping.get("type", "type")
-        if type_col in row.index and pd.notna(row.get(type_col)):
-            txn_type = self._parse_type(str(row[type_col]))
+    def _convert_row_scalar(
+        self,
+        idx: int,
+        date_val,
+        amount_val,
+        description: str,
+        reference: Optional[str],
+        type_val,
+        raw_data: dict,
+    ) -> Transaction:
+        """Convert one row's already-extracted scalars to a Transaction."""
+        txn_date = self._parse_date(date_val)
+        amount = self._parse_amount(amount_val)
+
+        if type_val is not None:
+            txn_type = self._parse_type(str(type_val))
         else:
             txn_type = TransactionType.CREDIT if amount >= 0 else TransactionType.DEBIT
 
@@ -151,9 +278,38 @@ class CSVParser:
             type=txn_type,
             reference=reference if reference and reference != "nan" else None,
             source="internal",
-            raw_data=row.to_dict(),
+            raw_data=raw_data,
         )
 
+    def _parse_date_column(self, series: pd.Series) -> list:
+        """
+        Parse a whole date column with one ``pd.to_datetime`` pass per
+        candidate format.
+
+        Each pass runs in pandas' C parser over only the still-unparsed
+        rows, replacing the per-row strptime format loop. Values no
+        format accepts are passed through unchanged so the scalar
+        fallback in ``_parse_date`` can handle (or reject) them.
+        """
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return series.tolist()
+
+        raw = series.tolist()
+        str_series = series.astype(str).str.strip()
+        parsed = pd.Series(pd.NaT, index=series.index)
+        for fmt in self.DATE_FORMATS:
+            mask = parsed.isna()
+            if not mask.any():
+                break
+            parsed[mask] = pd.to_datetime(
+                str_series[mask], format=fmt, errors="coerce"
+            )
+
+        return [
+            raw_value if pd.isna(parsed_value) else parsed_value
+            for raw_value, parsed_value in zip(raw, parsed)
+        ]
+
     def _parse_date(self, value) -> datetime:
         """Parse date from various formats."""
         if isinstance(value, datetime):
@@ -163,6 +319,26 @@ class CSVParser:
 
         str_value = str(value).strip()
 
+        # Fast path for the two overwhelmingly common 10-char shapes:
+        # YYYY<sep>MM<sep>DD and DD<sep>MM<sep>YYYY. Slicing plus int()
+        # skips strptime's per-call format reparsing; anything that does
+        # not fit (including month/day swaps) falls through to the
+        # format loop, preserving its precedence.
+        if len(str_value) == 10:
+            try:
+                sep = str_value[4]
+                if sep in "-/." and str_value[7] == sep:
+                    return datetime(
+                        int(str_value[:4]), int(str_value[5:7]), int(str_value[8:10])
+                    )
+                sep = str_value[2]
+                if sep in "/-." and str_value[5] == sep:
+                    return datetime(
+                        int(str_value[6:10]), int(str_value[3:5]), int(str_value[:2])
+                    )
+            except ValueError:
+                pass
+
         for fmt in self.DATE_FORMATS:
             try:
                 return datetime.strptime(str_value, fmt)
@@ -171,10 +347,42 @@ class CSVParser:
 
         raise ValueError(f"Could not parse date: {value!r}")
 
+    def _parse_amount_column(self, series: pd.Series) -> list:
+        """
+        Normalize a string amount column in one vectorized pass.
+
+        Currency symbols and Brazilian/comma-decimal separators are
+        cleaned with ``Series.str`` operations over the whole column;
+        the per-row work left to ``_parse_amount`` is then just the
+        ``Decimal`` construction. Numeric columns are stringified in a
+        single astype pass rather than one str() call per scalar.
+        """
+        if pd.api.types.is_numeric_dtype(series):
+            return series.astype(str).tolist()
+
+        s = series.astype(str).str.strip()
+        s = s.str.replace(_CURRENCY_RE, "", regex=True).str.strip()
+
+        has_comma = s.str.contains(",", regex=False)
+        if has_comma.any():
+            has_dot = s.str.contains(".", regex=False)
+            # Brazilian format (1.234,56): last comma after last dot
+            brazilian = has_comma & has_dot & (s.str.rfind(",") > s.str.rfind("."))
+            s[brazilian] = (
+                s[brazilian]
+                .str.replace(".", "", regex=False)
+                .str.replace(",", ".", regex=False)
+            )
+            # Comma as decimal separator (1234,56)
+            comma_decimal = has_comma & ~has_dot
+            s[comma_decimal] = s[comma_decimal].str.replace(",", ".", regex=False)
+
+        return s.tolist()
+
     def _parse_amount(self, value) -> Decimal:
         """Parse amount handling various number formats."""
         if isinstance(value, (int, float)):
-            return Decimal(str(value))
+            return MONEY_CONTEXT.create_decimal(str(value))
 
         str_value = str(value).strip()
 
@@ -188,19 +396,13 @@ class CSVParser:
             str_value = str_value.replace(",", ".")
 
         # Remove currency symbols and whitespace
-        str_value = str_value.replace("R$", "").replace("$", "").strip()
+        str_value = _CURRENCY_RE.sub("", str_value).strip()
 
-        return Decimal(str_value)
+        return MONEY_CONTEXT.create_decimal(str_value)
 
     def _parse_type(self, value: str) -> TransactionType:
         """Parse transaction type from string."""
-        normalized = value.lower().strip()
-        credit_words = {"credit", "crédito", "credito", "c", "entrada", "receipt"}
-        debit_words = {"debit", "débito", "debito", "d", "saída", "saida", "payment"}
-
-        if normalized in credit_words:
-            return TransactionType.CREDIT
-        elif normalized in debit_words:
-            return TransactionType.DEBIT
-        else:
+        txn_type = _TYPE_LOOKUP.get(value.lower().strip())
+        if txn_type is None:
             raise ValueError(f"Unknown transaction type: {value!r}")
+        return txn_type
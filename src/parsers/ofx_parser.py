@@ -1,19 +1,64 @@
 """OFX bank statement parser."""
 
+import hashlib
+import re
+from collections import ChainMap
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterator, List, Optional, Tuple
 from uuid import uuid4
 
 from ofxparse import OfxParser as OfxLib
 
-from src.engine.models import Transaction, TransactionType
+from src.engine.models import MONEY_CONTEXT, Transaction, TransactionType
+
+# Enum lookups hoisted out of the per-transaction loop
+_CREDIT = TransactionType.CREDIT
+_DEBIT = TransactionType.DEBIT
+
+# Patterns for the lean OFX 1.x (SGML) stream parser. Reconciliation
+# only reads a handful of STMTTRN fields, so a scan over the raw text
+# avoids materializing ofxparse's full document tree.
+_STMTTRN_RE = re.compile(r"<STMTTRN>(.*?)</STMTTRN>", re.IGNORECASE | re.DOTALL)
+_TXN_FIELD_RE = re.compile(
+    r"<(TRNAMT|DTPOSTED|FITID|MEMO|NAME|CHECKNUM|TRNTYPE)>([^<\r\n]+)"
+)
+_ACCTID_RE = re.compile(r"<ACCTID>([^<\r\n]+)")
+_BANKID_RE = re.compile(r"<BANKID>([^<\r\n]+)")
+
+# OFX 1.x header fields that declare the file's text encoding.
+_CHARSET_RE = re.compile(rb"^CHARSET:(\S+)", re.MULTILINE)
+_ENCODING_RE = re.compile(rb"^ENCODING:(\S+)", re.MULTILINE)
+
+
+def _parse_one(file_path: str | Path) -> List[Transaction]:
+    """Parse a single OFX file; module-level so worker processes can pickle it."""
+    return OFXParser().parse(file_path)
 
 
 class OFXParser:
     """Parse OFX/QFX bank statement files into Transaction objects."""
 
+    #: Minimum number of cache-miss files before a worker pool is worth
+    #: spinning up; small batches parse faster serially than the pool
+    #: starts.
+    PARALLEL_MIN_FILES = 4
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize the parser.
+
+        Args:
+            max_workers: Optional process count for parse_multiple; large
+                batches are parsed in parallel when set to 2 or more.
+        """
+        self.max_workers = max_workers
+        # Content-keyed cache for parse_multiple; reprocessing runs that
+        # scan an identical statement skip the parse entirely.
+        self._cache: Dict[str, List[Transaction]] = {}
+
     def parse(self, file_path: str | Path) -> List[Transaction]:
         """
         Parse an OFX file and return a list of Transaction objects.
@@ -28,28 +73,137 @@ class OFXParser:
             FileNotFoundError: If the file doesn't exist.
             ValueError: If the file cannot be parsed.
         """
-        file_path = Path(file_path)
+        return list(self._iter_parse(Path(file_path)))
 
+    def _iter_parse(self, file_path: Path) -> Iterator[Transaction]:
+        """Yield Transactions from one OFX file without building a list."""
         if not file_path.exists():
             raise FileNotFoundError(f"OFX file not found: {file_path}")
 
         if file_path.suffix.lower() not in (".ofx", ".qfx"):
             raise ValueError(f"Unsupported file format: {file_path.suffix}")
 
+        text = self._decode_ofx(file_path.read_bytes())
+        if text is not None and self._can_stream(text):
+            yield from self._iter_parse_stream(text)
+        else:
+            yield from self._iter_parse_ofxlib(file_path)
+
+    @staticmethod
+    def _decode_ofx(raw: bytes) -> Optional[str]:
+        """
+        Decode OFX bytes honoring the declared ENCODING/CHARSET header.
+
+        Brazilian statements routinely carry CHARSET:1252 accents
+        ("Dep\u00f3sito sal\u00e1rio"); decoding with the platform default and
+        errors="ignore" would drop those bytes silently. Returns ``None``
+        when the bytes don't decode cleanly under the declared encoding,
+        so the caller falls back to ofxparse.
+        """
+        header = raw[:512]
+        charset_match = _CHARSET_RE.search(header)
+        charset = (
+            charset_match.group(1).decode("ascii", "ignore").upper()
+            if charset_match
+            else ""
+        )
+        if charset == "1252":
+            encoding = "cp1252"
+        elif charset.startswith("8859"):
+            encoding = "iso-8859-1"
+        else:
+            encoding_match = _ENCODING_RE.search(header)
+            declared = (
+                encoding_match.group(1).decode("ascii", "ignore").upper()
+                if encoding_match
+                else ""
+            )
+            if declared == "USASCII":
+                encoding = "ascii"
+            else:
+                # UTF-8, UNICODE, or an OFX 2.x/undeclared header
+                encoding = "utf-8"
+
+        try:
+            return raw.decode(encoding)
+        except UnicodeDecodeError:
+            return None
+
+    @staticmethod
+    def _can_stream(text: str) -> bool:
+        """
+        Whether the lean SGML scan can handle this file.
+
+        OFX 2.x (XML) and multi-account statements go through ofxparse,
+        which understands the full document structure.
+        """
+        if "<?xml" in text[:512].lower():
+            return False
+        return (
+            len(_ACCTID_RE.findall(text)) == 1
+            and _STMTTRN_RE.search(text) is not None
+        )
+
+    def _iter_parse_stream(self, text: str) -> Iterator[Transaction]:
+        """Scan STMTTRN blocks straight out of OFX 1.x SGML text."""
+        acct_match = _ACCTID_RE.search(text)
+        bank_match = _BANKID_RE.search(text)
+        # Account metadata is identical for every transaction in the
+        # statement; share one base mapping by reference instead of
+        # copying it into each raw_data dict.
+        base_raw = {
+            "account_id": acct_match.group(1).strip() if acct_match else "",
+            "bank_id": bank_match.group(1).strip() if bank_match else "",
+        }
+
+        for block in _STMTTRN_RE.finditer(text):
+            fields = {
+                name: value.strip()
+                for name, value in _TXN_FIELD_RE.findall(block.group(1))
+            }
+            try:
+                amount = MONEY_CONTEXT.create_decimal(fields["TRNAMT"])
+                posted = fields["DTPOSTED"]
+                txn_date = datetime(
+                    int(posted[:4]), int(posted[4:6]), int(posted[6:8])
+                )
+            except (KeyError, ValueError, InvalidOperation) as e:
+                raise ValueError(f"Failed to parse OFX file: {e}") from e
+
+            yield Transaction(
+                id=fields.get("FITID") or str(uuid4()),
+                date=txn_date,
+                amount=amount,
+                description=fields.get("MEMO") or fields.get("NAME", ""),
+                type=_CREDIT if amount >= 0 else _DEBIT,
+                reference=fields.get("CHECKNUM"),
+                source="bank",
+                raw_data=ChainMap(
+                    # Lowercased to match what ofxparse reports, so both
+                    # parse paths produce identical raw_data.
+                    {"type": fields.get("TRNTYPE", "").lower()}, base_raw
+                ),
+            )
+
+    def _iter_parse_ofxlib(self, file_path: Path) -> Iterator[Transaction]:
+        """Full ofxparse path for XML and multi-account statements."""
         try:
             with open(file_path, "rb") as f:
                 ofx = OfxLib.parse(f)
         except Exception as e:
             raise ValueError(f"Failed to parse OFX file: {e}") from e
 
-        transactions: List[Transaction] = []
-
+        convert = self._convert_transaction
         for account in self._get_accounts(ofx):
+            # Account metadata is constant for every transaction in the
+            # statement; resolve it once per account and share the base
+            # mapping by reference.
+            base_raw = {
+                "account_id": getattr(account, "account_id", ""),
+                "bank_id": getattr(account, "routing_number", ""),
+            }
             for stmt_txn in account.statement.transactions:
-                txn = self._convert_transaction(stmt_txn, account)
-                transactions.append(txn)
-
-        return transactions
+                yield convert(stmt_txn, base_raw)
 
     def parse_multiple(self, file_paths: List[str | Path]) -> List[Transaction]:
         """
@@ -61,10 +215,47 @@ class OFXParser:
         Returns:
             Combined list of Transaction objects.
         """
-        all_transactions: List[Transaction] = []
-        for path in file_paths:
-            all_transactions.extend(self.parse(path))
-        return all_transactions
+        # Key each file by content so repeated or duplicate inputs are
+        # parsed once; blake2b is the fastest stdlib hash here.
+        paths = [Path(path) for path in file_paths]
+        digests = [
+            hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+            if path.exists()
+            else None
+            for path in paths
+        ]
+
+        misses: List[Tuple[str, Path]] = []
+        pending = set()
+        for path, digest in zip(paths, digests):
+            if digest is None or digest in self._cache or digest in pending:
+                continue
+            pending.add(digest)
+            misses.append((digest, path))
+
+        if (
+            self.max_workers
+            and self.max_workers > 1
+            and len(misses) >= self.PARALLEL_MIN_FILES
+        ):
+            # Files are parsed independently, and ofxparse is CPU-bound
+            # pure Python, so fan the cache misses out across processes.
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                parsed = executor.map(_parse_one, [path for _, path in misses])
+                for (digest, _), file_txns in zip(misses, parsed):
+                    self._cache[digest] = file_txns
+        else:
+            for digest, path in misses:
+                self._cache[digest] = list(self._iter_parse(path))
+
+        combined: List[Transaction] = []
+        for path, digest in zip(paths, digests):
+            if digest is None:
+                # Missing file: surface the parser's usual error.
+                combined.extend(self._iter_parse(path))
+            else:
+                combined.extend(self._cache[digest])
+        return combined
 
     def _get_accounts(self, ofx):
         """Extract accounts from parsed OFX data."""
@@ -74,18 +265,24 @@ class OFXParser:
             return [ofx.account]
         raise ValueError("No accounts found in OFX file")
 
-    def _convert_transaction(self, stmt_txn, account) -> Transaction:
-        """Convert an OFX statement transaction to our Transaction model."""
-        amount = Decimal(str(stmt_txn.amount))
+    def _convert_transaction(self, stmt_txn, base_raw: dict) -> Transaction:
+        """
+        Convert an OFX statement transaction to our Transaction model.
 
-        txn_type = (
-            TransactionType.CREDIT if amount >= 0
-            else TransactionType.DEBIT
-        )
+        ``base_raw`` is the per-account raw_data base mapping resolved
+        once in the parse loop and shared across the statement.
+        """
+        amount = MONEY_CONTEXT.create_decimal(str(stmt_txn.amount))
+        txn_type = _CREDIT if amount >= 0 else _DEBIT
 
         txn_date = stmt_txn.date
         if isinstance(txn_date, str):
-            txn_date = datetime.strptime(txn_date[:8], "%Y%m%d")
+            # OFX dates are fixed-layout YYYYMMDD...; sliced int
+            # conversion skips strptime's format interpretation, same
+            # as the stream parser.
+            txn_date = datetime(
+                int(txn_date[:4]), int(txn_date[4:6]), int(txn_date[6:8])
+            )
 
         return Transaction(
             id=getattr(stmt_txn, "id", str(uuid4())),
@@ -95,9 +292,5 @@ class OFXParser:
             type=txn_type,
             reference=getattr(stmt_txn, "checknum", None),
             source="bank",
-            raw_data={
-                "account_id": getattr(account, "account_id", ""),
-                "bank_id": getattr(account, "routing_number", ""),
-                "type": getattr(stmt_txn, "type", ""),
-            },
+            raw_data=ChainMap({"type": getattr(stmt_txn, "type", "")}, base_raw),
         )
@@ -1,20 +1,49 @@
 """Excel report generator for reconciliation results."""
 
+import sys
 from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+try:
+    # openpyxl's write-only mode serializes through lxml when it is
+    # available, which is markedly faster than the stdlib fallback.
+    import lxml  # noqa: F401
+except ImportError as e:
+    raise ImportError(
+        "lxml is required for fast Excel report generation; "
+        "install it with 'pip install lxml'"
+    ) from e
 
 from openpyxl import Workbook
-from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
-from openpyxl.utils import get_column_letter
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.utils import column_index_from_string, get_column_letter
 
 from src.engine.models import MatchConfidence, MatchResult, MatchStatus, ReconciliationSummary
 
+# Reconciliation data repeats payees and references heavily; interning
+# the emitted strings lets openpyxl's shared-strings dict dedupe them
+# with pointer-fast hashing and keeps one copy in memory per distinct
+# value.
+_intern = sys.intern
+
 
 class ExcelReportGenerator:
     """Generate professional Excel reports from reconciliation results."""
 
+    #: Result count above which tab classification switches to NumPy
+    #: mask arrays; below it a plain Python loop is faster.
+    VECTORIZE_MIN_RESULTS = 10_000
+
+    #: Result count above which generate() defaults to write-only
+    #: streaming; holding that many styled Cell objects dominates both
+    #: save time and memory.
+    WRITE_ONLY_MIN_RESULTS = 100_000
+
     # Style constants
     HEADER_FILL = PatternFill(start_color="1F4E79", end_color="1F4E79", fill_type="solid")
     HEADER_FONT = Font(name="Calibri", size=11, bold=True, color="FFFFFF")
@@ -24,6 +53,8 @@ class ExcelReportGenerator:
     TITLE_FONT = Font(name="Calibri", size=16, bold=True, color="1F4E79")
     SUBTITLE_FONT = Font(name="Calibri", size=12, bold=True, color="1F4E79")
     KPI_FONT = Font(name="Calibri", size=14, bold=True)
+    LABEL_FONT = Font(bold=True)
+    CENTER = Alignment(horizontal="center")
     THIN_BORDER = Border(
         left=Side(style="thin"),
         right=Side(style="thin"),
@@ -31,6 +62,21 @@ class ExcelReportGenerator:
         bottom=Side(style="thin"),
     )
 
+    def __init__(self, write_only: Optional[bool] = None):
+        """
+        Initialize the report generator.
+
+        Args:
+            write_only: Stream rows through openpyxl's write-only mode.
+                Keeps memory flat for reports with very large tabs at the
+                cost of the merged title row on the Summary tab (merges
+                are unsupported in write-only worksheets). The default
+                (None) picks streaming automatically once the result
+                count reaches WRITE_ONLY_MIN_RESULTS.
+        """
+        self._write_only_opt = write_only
+        self.write_only = bool(write_only)
+
     def generate(
         self,
         results: List[MatchResult],
@@ -51,26 +97,31 @@ class ExcelReportGenerator:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        wb = Workbook()
+        if self._write_only_opt is None:
+            self.write_only = len(results) >= self.WRITE_ONLY_MIN_RESULTS
+
+        wb = Workbook(write_only=self.write_only)
+        if not self.write_only:
+            # One registered style for currency cells; applying it by
+            # name is cheaper than storing a format string per cell.
+            wb.add_named_style(NamedStyle(name="money", number_format='#,##0.00'))
+
+        matched, buckets = self._classify_results(results)
 
         # Tab 1: Summary
         self._create_summary_tab(wb, summary)
 
         # Tab 2: Matched Transactions
-        matched = [r for r in results if r.is_matched]
         self._create_matched_tab(wb, matched)
 
         # Tab 3: Bank Only (Unmatched)
-        bank_only = [r for r in results if r.status == MatchStatus.UNMATCHED_BANK]
-        self._create_bank_only_tab(wb, bank_only)
+        self._create_bank_only_tab(wb, buckets[MatchStatus.UNMATCHED_BANK])
 
         # Tab 4: Internal Only (Unmatched)
-        internal_only = [r for r in results if r.status == MatchStatus.UNMATCHED_INTERNAL]
-        self._create_internal_only_tab(wb, internal_only)
+        self._create_internal_only_tab(wb, buckets[MatchStatus.UNMATCHED_INTERNAL])
 
         # Tab 5: Duplicates
-        duplicates = [r for r in results if r.status == MatchStatus.DUPLICATE]
-        self._create_duplicates_tab(wb, duplicates)
+        self._create_duplicates_tab(wb, buckets[MatchStatus.DUPLICATE])
 
         # Remove default sheet if extra
         if "Sheet" in wb.sheetnames and len(wb.sheetnames) > 1:
@@ -79,8 +130,86 @@ class ExcelReportGenerator:
         wb.save(str(output_path))
         return output_path
 
+    def _classify_results(
+        self, results: List[MatchResult]
+    ) -> Tuple[List[MatchResult], dict]:
+        """
+        Route every result to its tab in one pass instead of filtering
+        the full list once per tab. Large result sets compare a status
+        array in NumPy and gather by index; for small ones the plain
+        loop wins.
+        """
+        unmatched_statuses = (
+            MatchStatus.UNMATCHED_BANK,
+            MatchStatus.UNMATCHED_INTERNAL,
+            MatchStatus.DUPLICATE,
+        )
+
+        if len(results) >= self.VECTORIZE_MIN_RESULTS:
+            statuses = np.fromiter(
+                (r.status.value for r in results), dtype="U18", count=len(results)
+            )
+            matched_mask = (statuses == MatchStatus.EXACT.value) | (
+                statuses == MatchStatus.FUZZY.value
+            )
+            matched = [results[i] for i in np.flatnonzero(matched_mask)]
+            buckets = {
+                status: [
+                    results[i] for i in np.flatnonzero(statuses == status.value)
+                ]
+                for status in unmatched_statuses
+            }
+            return matched, buckets
+
+        matched = []
+        buckets = {status: [] for status in unmatched_statuses}
+        for result in results:
+            if result.is_matched:
+                matched.append(result)
+            else:
+                buckets[result.status].append(result)
+        return matched, buckets
+
+    @staticmethod
+    def _summary_kpis(summary: ReconciliationSummary) -> List[tuple]:
+        """KPI (label, value) pairs shown on the Summary tab."""
+        return [
+            ("Match Rate", f"{summary.match_rate:.1f}%"),
+            ("Total Matched", str(summary.total_matched)),
+            ("Exact Matches", str(summary.total_exact_matches)),
+            ("Fuzzy Matches", str(summary.total_fuzzy_matches)),
+            ("Unmatched (Bank)", str(summary.total_unmatched_bank)),
+            ("Unmatched (Internal)", str(summary.total_unmatched_internal)),
+            ("Duplicates Found", str(summary.total_duplicates)),
+        ]
+
+    @staticmethod
+    def _summary_amounts(summary: ReconciliationSummary) -> List[tuple]:
+        """Amount (label, Decimal) pairs shown on the Summary tab."""
+        return [
+            ("Total Bank Amount", summary.total_bank_amount),
+            ("Total Internal Amount", summary.total_internal_amount),
+            ("Amount Difference", summary.amount_difference),
+            ("Matched Amount", summary.matched_amount),
+            ("Unmatched Bank Amount", summary.unmatched_bank_amount),
+            ("Unmatched Internal Amount", summary.unmatched_internal_amount),
+        ]
+
+    def _kpi_fill(self, label: str, value: str) -> Optional[PatternFill]:
+        """Color coding for a KPI value cell, or None."""
+        if "Unmatched" in label and int(value) > 0:
+            return self.UNMATCHED_FILL
+        if "Match Rate" in label:
+            rate = float(value.replace("%", ""))
+            return self.MATCHED_FILL if rate >= 95 else self.UNMATCHED_FILL
+        return None
+
     def _create_summary_tab(self, wb: Workbook, summary: ReconciliationSummary) -> None:
         """Create the Summary dashboard tab."""
+        if self.write_only:
+            self._stream_summary_tab(wb, summary)
+            return
+
         ws = wb.active
         ws.title = "Summary"
         ws.sheet_properties.tabColor = "1F4E79"
@@ -89,39 +218,28 @@ class ExcelReportGenerator:
         ws.merge_cells("A1:F1")
         ws["A1"] = "Bank Reconciliation Report"
         ws["A1"].font = self.TITLE_FONT
-        ws["A1"].alignment = Alignment(horizontal="center")
+        ws["A1"].alignment = self.CENTER
 
         # Generated date
         ws.merge_cells("A2:F2")
         ws["A2"] = f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        ws["A2"].alignment = Alignment(horizontal="center")
+        ws["A2"].alignment = self.CENTER
 
         # KPIs
-        kpis = [
-            ("Match Rate", f"{summary.match_rate:.1f}%"),
-            ("Total Matched", str(summary.total_matched)),
-            ("Exact Matches", str(summary.total_exact_matches)),
-            ("Fuzzy Matches", str(summary.total_fuzzy_matches)),
-            ("Unmatched (Bank)", str(summary.total_unmatched_bank)),
-            ("Unmatched (Internal)", str(summary.total_unmatched_internal)),
-            ("Duplicates Found", str(summary.total_duplicates)),
-        ]
+        kpis = self._summary_kpis(summary)
 
         ws["A4"] = "Key Performance Indicators"
         ws["A4"].font = self.SUBTITLE_FONT
 
         for i, (label, value) in enumerate(kpis, start=5):
             ws[f"A{i}"] = label
-            ws[f"A{i}"].font = Font(bold=True)
+            ws[f"A{i}"].font = self.LABEL_FONT
             ws[f"B{i}"] = value
             ws[f"B{i}"].font = self.KPI_FONT
 
-            # Color coding
-            if "Unmatched" in label and int(value) > 0:
-                ws[f"B{i}"].fill = self.UNMATCHED_FILL
-            elif "Match Rate" in label:
-                rate = float(value.replace("%", ""))
-                ws[f"B{i}"].fill = self.MATCHED_FILL if rate >= 95 else self.UNMATCHED_FILL
+            fill = self._kpi_fill(label, value)
+            if fill is not None:
+                ws[f"B{i}"].fill = fill
 
         # Amounts section
         row = len(kpis) + 7
@@ -129,26 +247,54 @@ class ExcelReportGenerator:
         ws[f"A{row}"].font = self.SUBTITLE_FONT
         row += 1
 
-        amounts = [
-            ("Total Bank Amount", summary.total_bank_amount),
-            ("Total Internal Amount", summary.total_internal_amount),
-            ("Amount Difference", summary.amount_difference),
-            ("Matched Amount", summary.matched_amount),
-            ("Unmatched Bank Amount", summary.unmatched_bank_amount),
-            ("Unmatched Internal Amount", summary.unmatched_internal_amount),
-        ]
-
-        for label, amount in amounts:
+        for label, amount in self._summary_amounts(summary):
             ws[f"A{row}"] = label
-            ws[f"A{row}"].font = Font(bold=True)
+            ws[f"A{row}"].font = self.LABEL_FONT
             ws[f"B{row}"] = float(amount)
-            ws[f"B{row}"].number_format = '#,##0.00'
+            ws[f"B{row}"].style = "money"
             row += 1
 
         # Auto-width
         ws.column_dimensions["A"].width = 25
         ws.column_dimensions["B"].width = 20
 
+    def _stream_summary_tab(self, wb: Workbook, summary: ReconciliationSummary) -> None:
+        """Summary tab for write-only workbooks: append-only, no merges."""
+        ws = wb.create_sheet("Summary")
+        ws.sheet_properties.tabColor = "1F4E79"
+        ws.column_dimensions["A"].width = 25
+        ws.column_dimensions["B"].width = 20
+
+        def styled(value, font=None, fill=None, number_format=None):
+            cell = WriteOnlyCell(ws, value=value)
+            if font is not None:
+                cell.font = font
+            if fill is not None:
+                cell.fill = fill
+            if number_format is not None:
+                cell.number_format = number_format
+            return cell
+
+        label_font = self.LABEL_FONT
+
+        ws.append([styled("Bank Reconciliation Report", font=self.TITLE_FONT)])
+        ws.append([f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"])
+        ws.append([])
+        ws.append([styled("Key Performance Indicators", font=self.SUBTITLE_FONT)])
+        for label, value in self._summary_kpis(summary):
+            ws.append([
+                styled(label, font=label_font),
+                styled(value, font=self.KPI_FONT, fill=self._kpi_fill(label, value)),
+            ])
+        ws.append([])
+        ws.append([])
+        ws.append([styled("Amount Summary", font=self.SUBTITLE_FONT)])
+        for label, amount in self._summary_amounts(summary):
+            ws.append([
+                styled(label, font=label_font),
+                styled(float(amount), number_format='#,##0.00'),
+            ])
+
     def _create_matched_tab(self, wb: Workbook, matched: List[MatchResult]) -> None:
         """Create the Matched Transactions tab."""
         ws = wb.create_sheet("Matched")
@@ -162,31 +308,32 @@ class ExcelReportGenerator:
 
         self._write_headers(ws, headers)
 
-        for i, result in enumerate(matched, start=2):
+        # Assemble plain value tuples first, then emit them in one
+        # batch; coordinate strings like "B{i}" would make openpyxl
+        # re-parse a cell reference for every value.
+        rows = []
+        for result in matched:
             bank = result.bank_transaction
             internal = result.internal_transaction
-
-            ws[f"A{i}"] = bank.date.strftime("%Y-%m-%d") if bank else ""
-            ws[f"B{i}"] = float(bank.amount) if bank else 0
-            ws[f"B{i}"].number_format = '#,##0.00'
-            ws[f"C{i}"] = (bank.description[:50] if bank else "")
-            ws[f"D{i}"] = (bank.reference or "") if bank else ""
-            ws[f"E{i}"] = internal.date.strftime("%Y-%m-%d") if internal else ""
-            ws[f"F{i}"] = float(internal.amount) if internal else 0
-            ws[f"F{i}"].number_format = '#,##0.00'
-            ws[f"G{i}"] = (internal.description[:50]) if internal else ""
-            ws[f"H{i}"] = (internal.reference or "") if internal else ""
-            ws[f"I{i}"] = result.status.value
-            ws[f"J{i}"] = result.confidence.value
-            ws[f"K{i}"] = result.date_diff_days
-            ws[f"L{i}"] = float(result.amount_diff)
-            ws[f"L{i}"].number_format = '#,##0.00'
-            ws[f"M{i}"] = result.match_reason
-
-            # Apply row fill
-            fill = self.MATCHED_FILL
-            for col in range(1, len(headers) + 1):
-                ws.cell(row=i, column=col).fill = fill
+            rows.append((
+                bank.date.strftime("%Y-%m-%d") if bank else "",
+                float(bank.amount) if bank else 0,
+                _intern(bank.description[:50]) if bank else "",
+                _intern(bank.reference or "") if bank else "",
+                internal.date.strftime("%Y-%m-%d") if internal else "",
+                float(internal.amount) if internal else 0,
+                _intern(internal.description[:50]) if internal else "",
+                _intern(internal.reference or "") if internal else "",
+                result.status.value,
+                result.confidence.value,
+                result.date_diff_days,
+                float(result.amount_diff),
+                result.match_reason,
+            ))
+        self._append_data_rows(ws, rows, self.MATCHED_FILL, ("B", "F", "L"))
+
+        if matched:
+            self._style_data_rows(ws, len(headers), self.MATCHED_FILL, ("B", "F", "L"))
 
         self._auto_width(ws, headers)
 
@@ -198,20 +345,22 @@ class ExcelReportGenerator:
         headers = ["Date", "Amount", "Description", "Reference", "Type", "Reason"]
         self._write_headers(ws, headers)
 
-        for i, result in enumerate(bank_only, start=2):
-            txn = result.bank_transaction
-            if not txn:
-                continue
-            ws[f"A{i}"] = txn.date.strftime("%Y-%m-%d")
-            ws[f"B{i}"] = float(txn.amount)
-            ws[f"B{i}"].number_format = '#,##0.00'
-            ws[f"C{i}"] = txn.description[:80]
-            ws[f"D{i}"] = txn.reference or ""
-            ws[f"E{i}"] = txn.type.value
-            ws[f"F{i}"] = result.match_reason
-
-            for col in range(1, len(headers) + 1):
-                ws.cell(row=i, column=col).fill = self.UNMATCHED_FILL
+        rows = [
+            (
+                txn.date.strftime("%Y-%m-%d"),
+                float(txn.amount),
+                _intern(txn.description[:80]),
+                _intern(txn.reference or ""),
+                txn.type.value,
+                result.match_reason,
+            )
+            for result in bank_only
+            if (txn := result.bank_transaction)
+        ]
+        self._append_data_rows(ws, rows, self.UNMATCHED_FILL, ("B",))
+
+        if rows:
+            self._style_data_rows(ws, len(headers), self.UNMATCHED_FILL, ("B",))
 
         self._auto_width(ws, headers)
 
@@ -223,22 +372,22 @@ class ExcelReportGenerator:
         headers = ["Date", "Amount", "Description", "Reference", "Type", "Reason"]
         self._write_headers(ws, headers)
 
-        row = 2
-        for result in internal_only:
-            txn = result.internal_transaction
-            if not txn:
-                continue
-            ws[f"A{row}"] = txn.date.strftime("%Y-%m-%d")
-            ws[f"B{row}"] = float(txn.amount)
-            ws[f"B{row}"].number_format = '#,##0.00'
-            ws[f"C{row}"] = txn.description[:80]
-            ws[f"D{row}"] = txn.reference or ""
-            ws[f"E{row}"] = txn.type.value
-            ws[f"F{row}"] = result.match_reason
-
-            for col in range(1, len(headers) + 1):
-                ws.cell(row=row, column=col).fill = self.UNMATCHED_FILL
-            row += 1
+        rows = [
+            (
+                txn.date.strftime("%Y-%m-%d"),
+                float(txn.amount),
+                _intern(txn.description[:80]),
+                _intern(txn.reference or ""),
+                txn.type.value,
+                result.match_reason,
+            )
+            for result in internal_only
+            if (txn := result.internal_transaction)
+        ]
+        self._append_data_rows(ws, rows, self.UNMATCHED_FILL, ("B",))
+
+        if rows:
+            self._style_data_rows(ws, len(headers), self.UNMATCHED_FILL, ("B",))
 
         self._auto_width(ws, headers)
 
@@ -250,38 +399,102 @@ class ExcelReportGenerator:
         headers = ["Source", "Date", "Amount", "Description", "Reference", "Reason"]
         self._write_headers(ws, headers)
 
-        for i, result in enumerate(duplicates, start=2):
+        rows = []
+        for result in duplicates:
             txn = result.internal_transaction or result.bank_transaction
             source = "Internal" if result.internal_transaction else "Bank"
+            rows.append((
+                source,
+                txn.date.strftime("%Y-%m-%d"),
+                float(txn.amount),
+                _intern(txn.description[:80]),
+                _intern(txn.reference or ""),
+                _intern(result.match_reason),
+            ))
+        self._append_data_rows(ws, rows, self.DUPLICATE_FILL, ("C",))
+
+        if duplicates:
+            self._style_data_rows(ws, len(headers), self.DUPLICATE_FILL, ("C",))
 
-            ws[f"A{i}"] = source
-            ws[f"B{i}"] = txn.date.strftime("%Y-%m-%d")
-            ws[f"C{i}"] = float(txn.amount)
-            ws[f"C{i}"].number_format = '#,##0.00'
-            ws[f"D{i}"] = txn.description[:80]
-            ws[f"E{i}"] = txn.reference or ""
-            ws[f"F{i}"] = result.match_reason
+        self._auto_width(ws, headers)
 
-            for col in range(1, len(headers) + 1):
-                ws.cell(row=i, column=col).fill = self.DUPLICATE_FILL
+    def _append_data_rows(
+        self,
+        ws,
+        rows: List[Tuple],
+        fill: PatternFill,
+        money_columns: Tuple[str, ...],
+    ) -> None:
+        """
+        Append a tab's data rows in one tight loop.
 
-        self._auto_width(ws, headers)
+        Write-only worksheets cannot be revisited, so their cells carry
+        fill and number format before the append; normal worksheets take
+        the plain value tuples and are styled afterwards in
+        _style_data_rows. Taking the whole batch keeps per-row work down
+        to the append call itself.
+        """
+        if not self.write_only:
+            append = ws.append
+            for values in rows:
+                append(values)
+            return
+
+        money_idx = {column_index_from_string(c) - 1 for c in money_columns}
+        make_cell = WriteOnlyCell
+        append = ws.append
+        for values in rows:
+            cells = []
+            for idx, value in enumerate(values):
+                cell = make_cell(ws, value=value)
+                cell.fill = fill
+                if idx in money_idx:
+                    cell.number_format = '#,##0.00'
+                cells.append(cell)
+            append(cells)
+
+    def _style_data_rows(
+        self,
+        ws,
+        n_cols: int,
+        fill: PatternFill,
+        money_columns: Tuple[str, ...],
+    ) -> None:
+        """Post-pass number formats and row fill (normal workbooks only)."""
+        if self.write_only:
+            return
+        for col_letter in money_columns:
+            for cell in ws[col_letter][1:]:
+                cell.style = "money"
+        for row in ws.iter_rows(min_row=2, max_row=ws.max_row, max_col=n_cols):
+            for cell in row:
+                cell.fill = fill
 
     def _write_headers(self, ws, headers: List[str]) -> None:
         """Write styled header row."""
-        for col_idx, header in enumerate(headers, start=1):
-            cell = ws.cell(row=1, column=col_idx, value=header)
-            cell.font = self.HEADER_FONT
-            cell.fill = self.HEADER_FILL
-            cell.alignment = Alignment(horizontal="center")
-            cell.border = self.THIN_BORDER
-
-        # Freeze top row
+        # Freeze top row and add the auto-filter first: write-only
+        # worksheets serialize their view settings at the first append.
         ws.freeze_panes = "A2"
-
-        # Auto-filter
         ws.auto_filter.ref = f"A1:{get_column_letter(len(headers))}1"
 
+        if self.write_only:
+            cells = []
+            for header in headers:
+                cell = WriteOnlyCell(ws, value=header)
+                cell.font = self.HEADER_FONT
+                cell.fill = self.HEADER_FILL
+                cell.alignment = self.CENTER
+                cell.border = self.THIN_BORDER
+                cells.append(cell)
+            ws.append(cells)
+        else:
+            for col_idx, header in enumerate(headers, start=1):
+                cell = ws.cell(row=1, column=col_idx, value=header)
+                cell.font = self.HEADER_FONT
+                cell.fill = self.HEADER_FILL
+                cell.alignment = self.CENTER
+                cell.border = self.THIN_BORDER
+
     def _auto_width(self, ws, headers: List[str]) -> None:
         """Auto-adjust column widths."""
         for col_idx, header in enumerate(headers, start=1):
@@ -113,3 +113,20 @@ class TestCSVParser:
             txns = parser.parse(csv_file)
             assert txns[0].date.day == 15
             assert txns[0].date.month == 1
+
+    def test_chunked_parsing(self, tmp_path):
+        """Chunked streaming yields every row with unique, ordered ids."""
+        rows = "\n".join(
+            f"2025-01-{(i % 28) + 1:02d},{100 + i}.00,Row {i}" for i in range(25)
+        )
+        csv_file = tmp_path / "chunked.csv"
+        csv_file.write_text(f"date,amount,description\n{rows}\n")
+
+        parser = CSVParser()
+        transactions = list(parser.parse_iter(csv_file, chunksize=7))
+
+        assert len(transactions) == 25
+        ids = [t.id for t in transactions]
+        assert len(set(ids)) == 25  # no collisions across chunk boundaries
+        assert ids == sorted(ids)  # INT-nnnnnn ids stay in file order
+        assert [t.description for t in transactions[:3]] == ["Row 0", "Row 1", "Row 2"]
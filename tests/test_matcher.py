@@ -2,6 +2,7 @@
 
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 
 import pytest
 
@@ -14,6 +15,7 @@ from src.engine.models import (
 )
 
 
+@lru_cache(maxsize=None)
 def make_txn(
     id: str,
     date: str,
@@ -22,7 +24,7 @@ def make_txn(
     source: str = "bank",
     ref: str = None,
 ) -> Transaction:
-    """Helper to create test transactions."""
+    """Helper to create test transactions; memoized since tests never mutate them."""
     amt = Decimal(amount)
     return Transaction(
         id=id,
@@ -35,11 +37,35 @@ def make_txn(
     )
 
 
+@pytest.fixture(scope="session")
+def engine_cache():
+    """One engine per tolerance configuration for the whole run."""
+    return {}
+
+
+def get_engine(cache: dict, **kwargs) -> ReconciliationEngine:
+    """Fetch (or build) the cached engine for a tolerance combo."""
+    key = tuple(sorted(kwargs.items()))
+    return cache.setdefault(key, ReconciliationEngine(**kwargs))
+
+
+@pytest.fixture
+def engine_default(engine_cache):
+    """Shared engine with default tolerances."""
+    return get_engine(engine_cache)
+
+
+@pytest.fixture
+def engine_strict(engine_cache):
+    """Shared engine that only accepts exact date/amount matches."""
+    return get_engine(engine_cache, date_tolerance_days=0, amount_threshold=0.0)
+
+
 class TestExactMatching:
     """Test exact matching logic."""
 
-    def test_exact_match_same_date_and_amount(self):
-        engine = ReconciliationEngine()
+    def test_exact_match_same_date_and_amount(self, engine_default):
+        engine = engine_default
         bank = [make_txn("B1", "2025-01-15", "1000.00", source="bank")]
         internal = [make_txn("I1", "2025-01-15", "1000.00", source="internal")]
 
@@ -51,8 +77,8 @@ class TestExactMatching:
         assert matched[0].confidence == MatchConfidence.HIGH
         assert summary.match_rate == 100.0
 
-    def test_exact_match_with_reference(self):
-        engine = ReconciliationEngine()
+    def test_exact_match_with_reference(self, engine_default):
+        engine = engine_default
         bank = [make_txn("B1", "2025-01-15", "500.00", ref="REF001", source="bank")]
         internal = [make_txn("I1", "2025-01-15", "500.00", ref="REF001", source="internal")]
 
@@ -61,8 +87,8 @@ class TestExactMatching:
         assert len(matched) == 1
         assert "reference" in matched[0].match_reason
 
-    def test_no_match_different_date(self):
-        engine = ReconciliationEngine(date_tolerance_days=0)
+    def test_no_match_different_date(self, engine_strict):
+        engine = engine_strict
         bank = [make_txn("B1", "2025-01-15", "1000.00", source="bank")]
         internal = [make_txn("I1", "2025-01-20", "1000.00", source="internal")]
 
@@ -70,8 +96,8 @@ class TestExactMatching:
         matched = [r for r in results if r.is_matched]
         assert len(matched) == 0
 
-    def test_no_match_different_amount(self):
-        engine = ReconciliationEngine(amount_threshold=0.0)
+    def test_no_match_different_amount(self, engine_strict):
+        engine = engine_strict
         bank = [make_txn("B1", "2025-01-15", "1000.00", source="bank")]
         internal = [make_txn("I1", "2025-01-15", "1001.00", source="internal")]
 
@@ -83,8 +109,8 @@ class TestExactMatching:
 class TestFuzzyMatching:
     """Test fuzzy matching with tolerances."""
 
-    def test_fuzzy_match_within_date_tolerance(self):
-        engine = ReconciliationEngine(date_tolerance_days=3)
+    def test_fuzzy_match_within_date_tolerance(self, engine_cache):
+        engine = get_engine(engine_cache, date_tolerance_days=3)
         bank = [make_txn("B1", "2025-01-15", "1000.00", source="bank")]
         internal = [make_txn("I1", "2025-01-17", "1000.00", source="internal")]
 
@@ -94,8 +120,8 @@ class TestFuzzyMatching:
         assert matched[0].status == MatchStatus.FUZZY
         assert matched[0].date_diff_days == 2
 
-    def test_fuzzy_match_within_amount_threshold(self):
-        engine = ReconciliationEngine(amount_threshold=0.05)
+    def test_fuzzy_match_within_amount_threshold(self, engine_cache):
+        engine = get_engine(engine_cache, amount_threshold=0.05)
         bank = [make_txn("B1", "2025-01-15", "1000.00", source="bank")]
         internal = [make_txn("I1", "2025-01-15", "1040.00", source="internal")]
 
@@ -104,8 +130,21 @@ class TestFuzzyMatching:
         assert len(matched) == 1
         assert matched[0].status == MatchStatus.FUZZY
 
-    def test_no_fuzzy_match_outside_tolerance(self):
-        engine = ReconciliationEngine(date_tolerance_days=2, amount_threshold=0.01)
+    def test_conflicting_references_still_match_at_zero_tolerance(self, engine_strict):
+        """Same date/amount but different references must fuzzy-match even
+        with both tolerances at zero; only the exact phase compares
+        references."""
+        bank = [make_txn("B1", "2025-01-15", "100.00", ref="REF-A", source="bank")]
+        internal = [make_txn("I1", "2025-01-15", "100.00", ref="REF-B", source="internal")]
+
+        results, summary = engine_strict.reconcile(bank, internal)
+        matched = [r for r in results if r.is_matched]
+        assert len(matched) == 1
+        assert matched[0].status == MatchStatus.FUZZY
+        assert summary.total_matched == 1
+
+    def test_no_fuzzy_match_outside_tolerance(self, engine_cache):
+        engine = get_engine(engine_cache, date_tolerance_days=2, amount_threshold=0.01)
         bank = [make_txn("B1", "2025-01-15", "1000.00", source="bank")]
         internal = [make_txn("I1", "2025-01-20", "1050.00", source="internal")]
 
@@ -116,8 +155,8 @@ class TestFuzzyMatching:
 class TestDuplicateDetection:
     """Test duplicate transaction detection."""
 
-    def test_detect_bank_duplicates(self):
-        engine = ReconciliationEngine()
+    def test_detect_bank_duplicates(self, engine_default):
+        engine = engine_default
         bank = [
             make_txn("B1", "2025-01-15", "500.00", source="bank"),
             make_txn("B2", "2025-01-15", "500.00", source="bank"),
@@ -127,8 +166,8 @@ class TestDuplicateDetection:
         results, summary = engine.reconcile(bank, internal)
         assert summary.total_duplicates >= 1
 
-    def test_detect_internal_duplicates(self):
-        engine = ReconciliationEngine()
+    def test_detect_internal_duplicates(self, engine_default):
+        engine = engine_default
         bank = [make_txn("B1", "2025-01-15", "500.00", source="bank")]
         internal = [
             make_txn("I1", "2025-01-15", "500.00", source="internal"),
@@ -142,8 +181,8 @@ class TestDuplicateDetection:
 class TestMultipleTransactions:
     """Test with multiple transactions."""
 
-    def test_multiple_exact_matches(self):
-        engine = ReconciliationEngine()
+    def test_multiple_exact_matches(self, engine_default):
+        engine = engine_default
         bank = [
             make_txn("B1", "2025-01-10", "100.00", source="bank"),
             make_txn("B2", "2025-01-15", "200.00", source="bank"),
@@ -159,8 +198,8 @@ class TestMultipleTransactions:
         assert summary.total_matched == 3
         assert summary.match_rate == 100.0
 
-    def test_mixed_matched_and_unmatched(self):
-        engine = ReconciliationEngine()
+    def test_mixed_matched_and_unmatched(self, engine_default):
+        engine = engine_default
         bank = [
             make_txn("B1", "2025-01-10", "100.00", source="bank"),
             make_txn("B2", "2025-01-15", "999.99", source="bank"),
@@ -175,8 +214,26 @@ class TestMultipleTransactions:
         assert summary.total_unmatched_bank == 1
         assert summary.total_unmatched_internal == 1
 
-    def test_empty_inputs(self):
-        engine = ReconciliationEngine()
+    def test_parallel_matches_serial(self):
+        """Parallel fuzzy matching must produce the same results as serial."""
+        days = ReconciliationEngine.PARALLEL_MIN_BATCH + 50
+        bank = [
+            make_txn(f"B{i}", f"2020-01-01", f"{100 + i}.00", source="bank")
+            for i in range(days)
+        ]
+        internal = [
+            make_txn(f"I{i}", f"2020-01-02", f"{100 + i}.00", source="internal")
+            for i in range(days)
+        ]
+
+        _, serial_summary = ReconciliationEngine().reconcile(bank, internal)
+        _, parallel_summary = ReconciliationEngine(max_workers=2).reconcile(bank, internal)
+
+        assert parallel_summary == serial_summary
+        assert parallel_summary.total_matched == days
+
+    def test_empty_inputs(self, engine_default):
+        engine = engine_default
         results, summary = engine.reconcile([], [])
         assert summary.total_matched == 0
         assert summary.match_rate == 0.0
@@ -185,8 +242,8 @@ class TestMultipleTransactions:
 class TestSummary:
     """Test summary statistics."""
 
-    def test_summary_amounts(self):
-        engine = ReconciliationEngine()
+    def test_summary_amounts(self, engine_default):
+        engine = engine_default
         bank = [
             make_txn("B1", "2025-01-10", "100.00", source="bank"),
             make_txn("B2", "2025-01-15", "200.00", source="bank"),
@@ -200,8 +257,8 @@ class TestSummary:
         assert summary.total_internal_amount == Decimal("100.00")
         assert summary.matched_amount == Decimal("100.00")
 
-    def test_match_rate_calculation(self):
-        engine = ReconciliationEngine()
+    def test_match_rate_calculation(self, engine_default):
+        engine = engine_default
         bank = [
             make_txn("B1", "2025-01-10", "100.00", source="bank"),
             make_txn("B2", "2025-01-15", "200.00", source="bank"),
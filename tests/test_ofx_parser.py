@@ -13,41 +13,37 @@ from src.engine.models import TransactionType
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
+@pytest.fixture(scope="module")
+def transactions():
+    """Parse the sample statement once for every read-only test."""
+    return OFXParser().parse(FIXTURES_DIR / "sample.ofx")
+
+
 class TestOFXParser:
     """Test OFX/QFX parsing functionality."""
 
-    def test_parse_sample_ofx(self):
+    def test_parse_sample_ofx(self, transactions):
         """Test parsing a valid OFX file returns transactions."""
-        parser = OFXParser()
-        transactions = parser.parse(FIXTURES_DIR / "sample.ofx")
-
         assert len(transactions) == 3
         assert all(t.source == "bank" for t in transactions)
 
-    def test_transaction_amounts(self):
+    def test_transaction_amounts(self, transactions):
         """Test that amounts are parsed correctly as Decimal."""
-        parser = OFXParser()
-        transactions = parser.parse(FIXTURES_DIR / "sample.ofx")
-
         amounts = sorted([t.amount for t in transactions])
         assert Decimal("-200.00") in amounts or Decimal("-200") in amounts
         assert Decimal("500.00") in amounts or Decimal("500") in amounts
         assert Decimal("1500.00") in amounts or Decimal("1500") in amounts
 
-    def test_transaction_dates(self):
+    def test_transaction_dates(self, transactions):
         """Test that dates are parsed correctly."""
-        parser = OFXParser()
-        transactions = parser.parse(FIXTURES_DIR / "sample.ofx")
 
         dates = sorted([t.date.date() for t in transactions])
         assert dates[0] == datetime(2025, 1, 10).date()
         assert dates[1] == datetime(2025, 1, 15).date()
         assert dates[2] == datetime(2025, 1, 20).date()
 
-    def test_transaction_types(self):
+    def test_transaction_types(self, transactions):
         """Test credit/debit type detection."""
-        parser = OFXParser()
-        transactions = parser.parse(FIXTURES_DIR / "sample.ofx")
 
         credits = [t for t in transactions if t.type == TransactionType.CREDIT]
         debits = [t for t in transactions if t.type == TransactionType.DEBIT]
@@ -55,28 +51,22 @@ class TestOFXParser:
         assert len(credits) == 2
         assert len(debits) == 1
 
-    def test_transaction_descriptions(self):
+    def test_transaction_descriptions(self, transactions):
         """Test that memo/description is captured."""
-        parser = OFXParser()
-        transactions = parser.parse(FIXTURES_DIR / "sample.ofx")
 
         descriptions = [t.description for t in transactions]
         assert any("Test deposit" in d for d in descriptions)
         assert any("Test withdrawal" in d for d in descriptions)
 
-    def test_transaction_references(self):
+    def test_transaction_references(self, transactions):
         """Test that check numbers are parsed as references."""
-        parser = OFXParser()
-        transactions = parser.parse(FIXTURES_DIR / "sample.ofx")
 
         refs = [t.reference for t in transactions if t.reference]
         assert "CHK001" in refs
         assert "CHK003" in refs
 
-    def test_transaction_ids(self):
+    def test_transaction_ids(self, transactions):
         """Test that FITIDs are used as transaction IDs."""
-        parser = OFXParser()
-        transactions = parser.parse(FIXTURES_DIR / "sample.ofx")
 
         ids = [t.id for t in transactions]
         assert "FIX001" in ids
@@ -116,10 +106,40 @@ class TestOFXParser:
         with pytest.raises(ValueError, match="Failed to parse"):
             parser.parse(bad_file)
 
-    def test_raw_data_contains_account_info(self):
+    def test_raw_data_contains_account_info(self, transactions):
         """Test that raw_data includes account metadata."""
-        parser = OFXParser()
-        transactions = parser.parse(FIXTURES_DIR / "sample.ofx")
 
         for txn in transactions:
             assert "account_id" in txn.raw_data
+
+    def test_raw_data_type_is_lowercase(self, transactions):
+        """Both parse paths report the OFX TRNTYPE lowercased."""
+        assert sorted(t.raw_data["type"] for t in transactions) == [
+            "credit", "credit", "debit",
+        ]
+
+    def test_cp1252_accents_survive_stream_parse(self, tmp_path):
+        """CHARSET:1252 statements keep their accented descriptions."""
+        content = (FIXTURES_DIR / "sample.ofx").read_text().replace(
+            "Test deposit", "Depósito salário"
+        )
+        ofx_file = tmp_path / "accented.ofx"
+        ofx_file.write_bytes(content.encode("cp1252"))
+
+        parser = OFXParser()
+        transactions = parser.parse(ofx_file)
+
+        descriptions = [t.description for t in transactions]
+        assert "Depósito salário" in descriptions
+
+    def test_parse_multi_account_statement(self):
+        """Multi-account statements go through the ofxparse fallback."""
+        parser = OFXParser()
+        transactions = parser.parse(FIXTURES_DIR / "sample_multi.ofx")
+
+        assert len(transactions) == 2
+        by_id = {t.id: t for t in transactions}
+        assert by_id["MUL001"].raw_data["account_id"] == "99999-0"
+        assert by_id["MUL002"].raw_data["account_id"] == "88888-1"
+        assert by_id["MUL001"].raw_data["type"] == "credit"
+        assert by_id["MUL002"].amount == Decimal("-75.00")